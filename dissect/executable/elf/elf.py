@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-import io
 from functools import cached_property, lru_cache
+from operator import itemgetter
 from typing import BinaryIO, Callable, Generic, Iterator, Optional, TypeVar, Union
 
 from dissect.cstruct import cstruct
@@ -54,27 +54,39 @@ class ELF:
             + self.section_table.dump_data()
         )
 
-        output_data.sort(key=lambda tup: tup[0])
-        output_buf = bytes()
+        output_data.sort(key=itemgetter(0))
+        output_parts = []
+        append = output_parts.append
+        output_size = 0
 
         for offset, output_bytes in output_data:
-            output_offset = offset - len(output_buf)
+            output_offset = offset - output_size
             relative_offset = output_offset + len(output_bytes)
             if output_offset < 0 and relative_offset > 0:
-                output_buf += output_bytes[abs(output_offset) :]
+                # A memoryview avoids copying the chunk just to trim the overlap;
+                # the final join materializes the bytes.
+                append(memoryview(output_bytes)[abs(output_offset) :])
+                output_size += relative_offset
             elif output_offset >= 0:
-                padding = b"\x00" * output_offset
-                output_buf += padding
-                output_buf += output_bytes
-        return output_buf
+                if output_offset:
+                    append(b"\x00" * output_offset)
+                append(output_bytes)
+                output_size += output_offset + len(output_bytes)
+        return b"".join(output_parts)
 
-    @property
+    @cached_property
     def dynamic(self) -> bool:
         return self.header.e_type == Elf_Type.ET_DYN
 
 
 T = TypeVar("T")
 
+# Symbol info fields cover a handful of values; memoize the enum member lookups
+# once instead of going through the enum call machinery for every symbol.
+_stb_lookup = lru_cache(16)(STB)
+_stt_lookup = lru_cache(16)(STT)
+_stv_lookup = lru_cache(4)(STV)
+
 
 class Table(Generic[T]):
     def __init__(self, entries: int) -> None:
@@ -82,8 +94,14 @@ class Table(Generic[T]):
         self.items: list[T] = [None] * entries
 
     def __iter__(self) -> Iterator[T]:
+        # Avoid going through __getitem__ for every entry; a full iteration only
+        # needs a single pass over the backing list.
+        items = self.items
         for idx in range(self.entries):
-            yield self[idx]
+            item = items[idx]
+            if item is None:
+                item = items[idx] = self._create_item(idx)
+            yield item
 
     def __getitem__(self, idx: int) -> T:
         if self.items[idx] is None:
@@ -175,23 +193,28 @@ class SectionTable(Table[Section]):
         self.string_table = None
         self.c_elf = c_elf
 
+        self._by_type = lru_cache(32)(self._by_type)
+        self._by_name = lru_cache(32)(self._by_name)
+
         if string_index:
             self.string_table: StringTable = self[string_index]
 
     def __repr__(self) -> str:
         return f"<SectionTable offset=0x{self.offset:x} size=0x{self.size:x}>"
 
-    def _create_item(self, idx: int) -> Section:
-        self.fh.seek(self.offset + self.size * idx)
-        _, section_type = self.c_elf.uint32[2](self.fh.read(8))
-        self.fh.seek(-8, io.SEEK_CUR)
+    @cached_property
+    def _uint32_pair(self) -> type:
+        # Building an array type with c_elf.uint32[2] creates a new type object on
+        # every call, so resolve it once and reuse it for every section header peek.
+        return self.c_elf.uint32[2]
 
-        return_class = Section
-        if section_type == SHT.STRTAB:
-            return_class = StringTable
-        if section_type in [SHT.DYNSYM, SHT.SYMTAB]:
-            return_class = SymbolTable
+    def _create_item(self, idx: int) -> Section:
+        offset = self.offset + self.size * idx
+        self.fh.seek(offset)
+        _, section_type = self._uint32_pair(self.fh.read(8))
+        self.fh.seek(offset)
 
+        return_class = _SECTION_CLASSES.get(section_type, Section)
         return return_class.from_section_table(self, idx)
 
     @classmethod
@@ -207,17 +230,22 @@ class SectionTable(Table[Section]):
         if not isinstance(section_types, list):
             types = [types]
 
+        return self._by_type(tuple(types))
+
+    def _by_type(self, types: tuple[int, ...]) -> list[Section]:
         return self.find(lambda x: x.type in types)
 
     def related_sections(self, segment: Segment) -> list[Section]:
         return self.find(lambda x: x.is_related(segment))
 
     def by_name(self, name: str) -> list[Section]:
+        return self._by_name(name)
+
+    def _by_name(self, name: str) -> list[Section]:
         return self.find(lambda x: x.name in name)
 
     def dump_table(self) -> tuple[int, bytes]:
-        buf = bytearray()
-        return self.offset, buf.join([x.header.dumps() for x in self])
+        return self.offset, b"".join(x.header.dumps() for x in self)
 
     def dump_data(self) -> list[tuple[int, bytes]]:
         return [(x.offset, x.contents) for x in self]
@@ -239,7 +267,7 @@ class Segment:
         self.offset = self.header.p_offset
         self.size = self.header.p_filesz
 
-        self._data = b""
+        self._data = None
         self.patched = False
 
     def __repr__(self) -> str:
@@ -250,7 +278,7 @@ class Segment:
         fh = table.fh
         return cls(fh, idx, table.c_elf)
 
-    @property
+    @cached_property
     def end(self) -> int:
         return self.offset + self.size
 
@@ -259,20 +287,19 @@ class Segment:
 
     @property
     def contents(self) -> bytes:
-        if not self._data:
+        if self._data is None:
             self.fh.seek(self.offset)
             self._data = self.fh.read(self.size)
         return self._data
 
-    def _alignment_padding(self, data_length: int) -> bytes:
-        padding = 0
-        if self.header.p_align > 1:
-            padding = data_length % self.header.p_align
-        return b"\x00" * padding
+    def _aligned_size(self, data_length: int) -> int:
+        # max() keeps the modulus valid for alignments of 0 and 1, which both
+        # mean no padding, without branching on the alignment value.
+        return data_length + data_length % max(self.header.p_align, 1)
 
     def patch(self, new_data: bytes) -> None:
         self.patched = True
-        self._data = new_data + self._alignment_padding(len(new_data))
+        self._data = new_data.ljust(self._aligned_size(len(new_data)), b"\x00")
         self.header.p_filesz = len(self._data)
 
 
@@ -309,12 +336,11 @@ class SegmentTable(Table[Segment]):
 
         return self.find(lambda x: x.type in types)
 
-    def dump_data(self) -> list[tuple[int, bytearray]]:
+    def dump_data(self) -> list[tuple[int, bytes]]:
         return [(x.offset, x.contents) for x in self]
 
-    def dump_table(self) -> tuple[int, bytearray]:
-        buf = bytearray()
-        return self.offset, buf.join([x.header.dumps() for x in self])
+    def dump_table(self) -> tuple[int, bytes]:
+        return self.offset, b"".join(x.header.dumps() for x in self)
 
 
 class StringTable(Section):
@@ -327,13 +353,20 @@ class StringTable(Section):
         return self._get_string(offset)
 
     def _get_string(self, index: int) -> str:
-        if index > len(self.contents) or index == SHN.UNDEF:
+        contents = self.contents
+        if index > len(contents) or index == SHN.UNDEF:
             return None
-        return self.c_elf.char[None](self.contents[index:]).decode("utf8")
+
+        end = contents.find(0, index)
+        if end < 0:
+            end = len(contents)
+        return contents[index:end].decode("utf8")
 
 
 class Symbol:
-    def __init__(self, fh: BinaryIO, idx: Optional[int] = None, c_elf: cstruct = c_elf_64):
+    __slots__ = ("symbol", "idx", "c_elf", "bind", "type", "size", "visibility", "_name")
+
+    def __init__(self, fh: Union[BinaryIO, bytes], idx: Optional[int] = None, c_elf: cstruct = c_elf_64):
         self.symbol = c_elf.Sym(fh)
         self.idx = idx
         self.c_elf = c_elf
@@ -341,12 +374,12 @@ class Symbol:
         endianness = "little" if c_elf.endian == "<" else "big"
 
         info = int.from_bytes(self.symbol.st_info, endianness)
-        self.bind = STB(info >> 4)
-        self.type = STT(info & 0xF)
+        self.bind = _stb_lookup(info >> 4)
+        self.type = _stt_lookup(info & 0xF)
         self.size = self.symbol.st_size
 
         other = int.from_bytes(self.symbol.st_other, endianness)
-        self.visibility = STV(other & 0x3)
+        self.visibility = _stv_lookup(other & 0x3)
 
         self._name = None
 
@@ -363,7 +396,7 @@ class Symbol:
     def from_symbol_table(cls, table: SymbolTable, idx: int) -> Symbol:
         offset = idx * table.entry_size
         data = table.contents[offset : offset + table.entry_size]
-        output = cls(io.BytesIO(data), idx, table.c_elf)
+        output = cls(data, idx, table.c_elf)
         output._set_name(table.link)
         return output
 
@@ -382,7 +415,7 @@ class Symbol:
     def value_based_on_shndx(self, table: SectionTable) -> int:
         symloc = self.symbol.st_shndx
         value = self.value
-        if symloc not in [SHN.UNDEF, SHN.ABS]:
+        if symloc not in (SHN.UNDEF, SHN.ABS):
             value += table[symloc].offset
         return value
 
@@ -397,3 +430,12 @@ class SymbolTable(Section, Table[Symbol]):
 
     def _create_item(self, idx: int) -> Symbol:
         return Symbol.from_symbol_table(self, idx)
+
+
+# Section subclasses by sh_type, keyed on the raw integer value as peeked by
+# SectionTable._create_item.
+_SECTION_CLASSES: dict[int, type[Section]] = {
+    SHT.STRTAB.value: StringTable,
+    SHT.DYNSYM.value: SymbolTable,
+    SHT.SYMTAB.value: SymbolTable,
+}